@@ -4,12 +4,32 @@ A Discord bot that runs a Game Boy emulator and allows users to play games
 collectively by reacting with emojis to control the game.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "Discord GameBoy Bot"
 
-from discordboy.bot import GameBoyBot
-from discordboy.config import Config
-from discordboy.controller import InputController
-from discordboy.emulator import GameBoyEmulator
-
 __all__ = ["GameBoyBot", "GameBoyEmulator", "InputController", "Config"]
+
+# Lazily resolved exports (PEP 562) so importing the package doesn't pull in
+# discord.py, PyBoy, and Pillow until a symbol is actually used
+_LAZY_IMPORTS = {
+    "GameBoyBot": "discordboy.bot",
+    "Config": "discordboy.config",
+    "InputController": "discordboy.controller",
+    "GameBoyEmulator": "discordboy.emulator",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so subsequent lookups skip this hook
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
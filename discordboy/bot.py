@@ -1,16 +1,27 @@
 """Main Discord bot implementation."""
 
 import asyncio
+import hashlib
+import io
 import logging
 import time
+from collections import OrderedDict
 
 import discord
 from discord.ext import commands
 
+try:
+    # Private discord.py helper; guarded so a future release moving it
+    # degrades to the public per-message API instead of breaking import
+    from discord.message import convert_emoji_reaction
+except ImportError:
+    convert_emoji_reaction = None
+
 from discordboy.config import Config
 from discordboy.controller import InputController
 from discordboy.emulator import GameBoyEmulator
-from discordboy.screenshot import capture_screenshot, create_error_image
+from discordboy.frameserver import FrameServer
+from discordboy.screenshot import capture_screenshot, create_error_image, recycle_buffer
 from discordboy.utils import (
     create_embed,
     format_game_name,
@@ -23,6 +34,41 @@ from discordboy.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of encoded frames kept in the per-game screenshot cache
+FRAME_CACHE_SIZE = 64
+
+# Control emojis pre-converted to reaction form once at import; Route still
+# URL-encodes them per request, so this only skips the per-call conversion.
+# None when the private helper is unavailable - see _add_reactions.
+_CONTROL_REACTIONS = (
+    tuple(convert_emoji_reaction(emoji) for emoji in Config.CONTROL_EMOJIS)
+    if convert_emoji_reaction is not None
+    else None
+)
+
+try:
+    # Optional speedup: xxh3 hashes the framebuffer ~5x faster than blake2b
+    from xxhash import xxh3_64_intdigest as _xxh3_64_intdigest
+except ImportError:
+    _xxh3_64_intdigest = None
+
+
+def _frame_hash(frame_bytes: bytes) -> int:
+    """Compute a compact content hash of a raw framebuffer.
+
+    Uses xxh3 when the optional xxhash package is installed, falling back
+    to stdlib blake2b otherwise.
+
+    Args:
+        frame_bytes: Raw pixel bytes from the emulator
+
+    Returns:
+        64-bit integer digest of the frame
+    """
+    if _xxh3_64_intdigest is not None:
+        return _xxh3_64_intdigest(frame_bytes)
+    return int.from_bytes(hashlib.blake2b(frame_bytes, digest_size=8).digest(), "big")
+
 
 class GameBoyBot(commands.Bot):
     """Discord bot for running Game Boy emulator."""
@@ -40,11 +86,19 @@ class GameBoyBot(commands.Bot):
         self.controller: InputController | None = None
         self.game_channel: discord.TextChannel | None = None
         self.current_message: discord.Message | None = None
+        self.current_message_id = 0  # Plain int guard for the reaction hot path
         self.game_loop_task: asyncio.Task | None = None
         self.is_running = False
         self.current_rom: str | None = None
         self.start_time: float | None = None
         self.input_count = 0
+        self.frame_server: FrameServer | None = None
+        self._frame_cache: OrderedDict[int, bytes] = OrderedDict()
+        self._last_posted_hash: int | None = None
+        # PyBoy is not thread-safe, and ticks run via asyncio.to_thread;
+        # every emulator touch (tick, send_input, frame read) must hold
+        # this lock so a button press can't race a tick in flight
+        self._emulator_lock = asyncio.Lock()
 
     async def setup_hook(self):
         """Set up bot commands."""
@@ -62,22 +116,33 @@ class GameBoyBot(commands.Bot):
 
         logger.info(f"Using game channel: {self.game_channel.name}")
 
+        # Start the frame server if a public URL is configured
+        if Config.PUBLIC_BASE_URL and not self.frame_server:
+            self.frame_server = FrameServer()
+            await self.frame_server.start()
+
         # Auto-start with default ROM if available
         if Config.DEFAULT_ROM and validate_rom(Config.DEFAULT_ROM):
             await self._start_game(Config.DEFAULT_ROM)
 
-    async def on_reaction_add(self, reaction: discord.Reaction, user: discord.User):
-        """Handle emoji reactions."""
-        # Ignore if not in game channel or game not running
-        if not self.is_running or reaction.message.channel.id != Config.GAME_CHANNEL_ID:
-            return
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        """Handle emoji reactions.
 
+        The raw event carries the message/user IDs directly, so reactions on
+        other messages are filtered without resolving a Message object from
+        cache or REST.
+        """
         # Only process reactions on the current game message
-        if not self.current_message or reaction.message.id != self.current_message.id:
+        if not self.is_running or payload.message_id != self.current_message_id:
+            return
+
+        # Resolve the user from cache only once the reaction is relevant
+        user = payload.member or self.get_user(payload.user_id)
+        if user is None:
             return
 
         # Process the input
-        emoji = str(reaction.emoji)
+        emoji = str(payload.emoji)
         await self.controller.handle_reaction(emoji, user)
         self.input_count += 1
 
@@ -101,7 +166,9 @@ class GameBoyBot(commands.Bot):
             self.emulator = GameBoyEmulator(rom_path, Config.GAME_SPEED)
 
             # Initialize controller with update callback
-            self.controller = InputController(self.emulator, self._update_screen)
+            self.controller = InputController(
+                self.emulator, self._update_screen, emulator_lock=self._emulator_lock
+            )
             await self.controller.start()
 
             # Start game loop (or just post initial screen if input-driven)
@@ -109,6 +176,8 @@ class GameBoyBot(commands.Bot):
             self.current_rom = rom_name
             self.start_time = time.time()
             self.input_count = 0
+            self._frame_cache.clear()
+            self._last_posted_hash = None
 
             if Config.INPUT_DRIVEN:
                 # Just post initial screen, updates happen on input
@@ -143,9 +212,12 @@ class GameBoyBot(commands.Bot):
             if self.controller:
                 await self.controller.stop()
 
-            # Clean up emulator
+            # Clean up emulator under the lock: cancelling a task blocked on
+            # to_thread does not stop the worker thread, so a tick may still
+            # be running when we get here
             if self.emulator:
-                self.emulator.close()
+                async with self._emulator_lock:
+                    self.emulator.close()
 
             # Delete current message
             if self.current_message:
@@ -154,8 +226,11 @@ class GameBoyBot(commands.Bot):
                 except Exception:
                     pass
                 self.current_message = None
+                self.current_message_id = 0
 
             self.current_rom = None
+            self._frame_cache.clear()
+            self._last_posted_hash = None
             logger.info("Game stopped")
 
         except Exception as e:
@@ -165,40 +240,36 @@ class GameBoyBot(commands.Bot):
         """Main game loop that updates the emulator and posts screenshots."""
         logger.info("Game loop started")
 
+        upload_task: asyncio.Task | None = None
+
         try:
             while self.is_running:
-                # Tick emulator forward
-                ticks = int(Config.TICKS_PER_UPDATE * Config.GAME_SPEED)
-                self.emulator.tick(ticks)
-
-                # Capture screenshot
+                # Tick emulator forward off the event loop so Discord I/O
+                # (reactions, heartbeat) stays responsive during emulation,
+                # holding the lock through the frame snapshot so a concurrent
+                # button press can't drive PyBoy from another thread
+                async with self._emulator_lock:
+                    await asyncio.to_thread(self.emulator.tick, Config.TICKS_PER_UPDATE_SCALED)
+                    frame = self.emulator.get_frame().copy()
+
+                # Idle screens (menus, dialogue waits) repeat the same frame
+                # across intervals; skip the encode and upload entirely then
+                frame_hash = _frame_hash(frame.tobytes())
+                if frame_hash == self._last_posted_hash and self.current_message:
+                    logger.debug("Frame unchanged, skipping loop update")
+                    await asyncio.sleep(Config.UPDATE_INTERVAL)
+                    continue
+
+                # Capture screenshot (the encode runs outside the lock)
                 overlay_text = f"{format_game_name(self.current_rom)}"
-                screenshot = await capture_screenshot(self.emulator, overlay_text)
-
-                # Post or edit message with new screenshot
-                file = discord.File(screenshot, filename="game.png")
-
-                if not self.current_message:
-                    # First message - create it
-                    self.current_message = await self.game_channel.send(file=file)
+                screenshot = await capture_screenshot(self.emulator, overlay_text, frame=frame)
 
-                    # Add reaction controls only once
-                    for emoji in Config.CONTROL_EMOJIS:
-                        try:
-                            await self.current_message.add_reaction(emoji)
-                        except Exception as e:
-                            logger.error(f"Failed to add reaction {emoji}: {e}")
-                else:
-                    # Update by deleting and reposting (Discord doesn't allow editing attachments)
-                    try:
-                        await self.current_message.delete()
-                    except Exception:
-                        pass
-
-                    self.current_message = await self.game_channel.send(file=file)
-
-                    # Re-add reactions (do this in background to avoid blocking)
-                    asyncio.create_task(self._add_reactions(self.current_message))
+                # Wait for the previous upload before replacing it, then post
+                # the new frame concurrently with the next tick/encode cycle
+                if upload_task:
+                    await upload_task
+                upload_task = asyncio.create_task(self._post_frame(screenshot))
+                self._last_posted_hash = frame_hash
 
                 # Wait for next update
                 await asyncio.sleep(Config.UPDATE_INTERVAL)
@@ -209,51 +280,124 @@ class GameBoyBot(commands.Bot):
             logger.error(f"Error in game loop: {e}")
             await self._send_error(f"Game loop error: {str(e)}")
             self.is_running = False
+        finally:
+            if upload_task and not upload_task.done():
+                upload_task.cancel()
 
     async def _update_screen(self):
         """Update the game screenshot (used in input-driven mode)."""
         try:
-            # Tick emulator a few frames
-            self.emulator.tick(30)  # Half second of gameplay
+            async with self._emulator_lock:
+                # Tick emulator a few frames (off the event loop)
+                await asyncio.to_thread(self.emulator.tick, 30)  # Half second of gameplay
 
-            # Capture screenshot
-            overlay_text = f"{format_game_name(self.current_rom)}"
-            screenshot = await capture_screenshot(self.emulator, overlay_text)
+                # Snapshot the framebuffer while still holding the lock: the
+                # hash, the cache entry and the encode below must all describe
+                # this exact frame, not whatever a later tick left behind
+                frame = self.emulator.get_frame().copy()
 
-            # Delete old message before posting new one
-            if self.current_message:
-                try:
-                    await self.current_message.delete()
-                except Exception:
-                    pass
+            # Hash the raw framebuffer to detect unchanged/repeated frames
+            frame_hash = _frame_hash(frame.tobytes())
 
-            # Post new message
-            file = discord.File(screenshot, filename="game.png")
-            new_message = await self.game_channel.send(file=file)
+            # Frame identical to what's already posted - nothing to do
+            if frame_hash == self._last_posted_hash and self.current_message:
+                logger.debug("Frame unchanged, skipping screen update")
+                return
 
-            # Track as current message for reactions
-            self.current_message = new_message
+            # Reuse cached encoded bytes for previously seen frames, otherwise encode
+            cached_bytes = self._frame_cache.get(frame_hash)
+            if cached_bytes is not None:
+                self._frame_cache.move_to_end(frame_hash)
+                screenshot = io.BytesIO(cached_bytes)
+            else:
+                overlay_text = f"{format_game_name(self.current_rom)}"
+                screenshot = await capture_screenshot(self.emulator, overlay_text, frame=frame)
+                self._frame_cache[frame_hash] = screenshot.getvalue()
+                while len(self._frame_cache) > FRAME_CACHE_SIZE:
+                    self._frame_cache.popitem(last=False)
 
-            # Add reactions to the new message (don't wait, do in background)
-            asyncio.create_task(self._add_reactions(new_message))
+            # Post or edit message with new screenshot
+            await self._post_frame(screenshot)
+            self._last_posted_hash = frame_hash
 
         except Exception as e:
             logger.error(f"Error updating screen: {e}")
 
-    async def _add_reactions(self, message: discord.Message):
-        """Add control reactions to a message (background task)."""
-        for emoji in Config.CONTROL_EMOJIS:
+    async def _post_frame(self, screenshot):
+        """Post a screenshot, editing the existing message in place when possible.
+
+        Editing the attachment is a single PATCH and keeps the existing
+        reactions, so they only need to be added on the first send.
+
+        Args:
+            screenshot: BytesIO buffer containing the encoded image
+        """
+        # With a frame server, updates are a tiny embed-URL PATCH instead of
+        # a multipart upload; the first send still attaches the file below
+        if self.frame_server and self.current_message:
+            content_type = f"image/{Config.SCREENSHOT_FORMAT.lower()}"
+            self.frame_server.update_frame(screenshot.getvalue(), content_type)
+
+            embed = discord.Embed()
+            embed.set_image(url=self.frame_server.frame_url(int(time.time() * 1000)))
+            try:
+                await self.current_message.edit(embed=embed, attachments=[])
+                recycle_buffer(screenshot)
+                return
+            except discord.HTTPException as e:
+                logger.debug(f"Embed edit failed, falling back to attachment: {e}")
+
+        file = discord.File(screenshot, filename=Config.screenshot_filename())
+
+        if self.current_message:
             try:
-                await message.add_reaction(emoji)
-                await asyncio.sleep(0.25)  # Small delay to avoid rate limits
-            except Exception as e:
-                logger.debug(f"Failed to add reaction {emoji}: {e}")
+                # Edit attachment in place - reactions persist across edits
+                await self.current_message.edit(attachments=[file])
+                recycle_buffer(screenshot)
+                return
+            except discord.HTTPException as e:
+                logger.debug(f"Attachment edit failed, falling back to repost: {e}")
+                try:
+                    await self.current_message.delete()
+                except Exception:
+                    pass
+                screenshot.seek(0)
+                file = discord.File(screenshot, filename=Config.screenshot_filename())
+
+        # First message (or repost fallback) - send and seed reactions
+        self.current_message = await self.game_channel.send(file=file)
+        self.current_message_id = self.current_message.id
+        recycle_buffer(screenshot)
+        asyncio.create_task(self._add_reactions(self.current_message))
+
+    async def _add_reactions(self, message: discord.Message):
+        """Add control reactions to a message (background task).
+
+        Dispatched concurrently; discord.py's internal rate limiter already
+        sequences the requests per bucket, so no artificial delay is needed.
+        Goes straight to the REST client with pre-converted reaction strings,
+        skipping the high-level add_reaction wrapper per emoji; falls back to
+        Message.add_reaction when the private conversion helper is missing.
+        """
+        if _CONTROL_REACTIONS is not None:
+            channel_id = message.channel.id
+            message_id = message.id
+            calls = (
+                self.http.add_reaction(channel_id, message_id, reaction)
+                for reaction in _CONTROL_REACTIONS
+            )
+        else:
+            calls = (message.add_reaction(emoji) for emoji in Config.CONTROL_EMOJIS)
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for emoji, result in zip(Config.CONTROL_EMOJIS, results, strict=False):
+            if isinstance(result, Exception):
+                logger.debug(f"Failed to add reaction {emoji}: {result}")
 
     async def _send_error(self, error_message: str):
         """Send an error message to the game channel."""
         try:
             error_image = await create_error_image(error_message)
-            file = discord.File(error_image, filename="error.png")
+            file = discord.File(error_image, filename=Config.screenshot_filename("error"))
             await self.game_channel.send(file=file)
         except Exception as e:
             logger.error(f"Failed to send error image: {e}")
@@ -320,8 +464,9 @@ class GameBoyBot(commands.Bot):
             await ctx.send("❌ Speed must be between 1 and 10.")
             return
 
-        self.emulator.set_speed(speed)
-        Config.GAME_SPEED = speed
+        async with self._emulator_lock:
+            self.emulator.set_speed(speed)
+        Config.set_game_speed(speed)
 
         embed = create_embed(
             "⚡ Speed Changed", f"Emulator speed set to **{speed}x**", discord.Color.blue()
@@ -339,7 +484,11 @@ class GameBoyBot(commands.Bot):
             await ctx.send("❌ No game is currently running.")
             return
 
-        self.emulator.reset()
+        # Reset closes and reboots PyBoy; a tick running in a worker
+        # thread at the same time would crash the Cython core
+        async with self._emulator_lock:
+            self.emulator.reset()
+        self._last_posted_hash = None  # Force the next update to post
         embed = create_embed(
             "🔄 Game Reset", "The game has been reset to the beginning.", discord.Color.orange()
         )
@@ -361,7 +510,8 @@ class GameBoyBot(commands.Bot):
 
         try:
             save_path = Config.get_save_path(save_name)
-            self.emulator.save_state(save_path)
+            async with self._emulator_lock:
+                self.emulator.save_state(save_path)
 
             embed = create_embed(
                 "💾 State Saved", f"Game state saved as: **{save_name}**", discord.Color.green()
@@ -391,7 +541,9 @@ class GameBoyBot(commands.Bot):
 
         try:
             save_path = Config.get_save_path(save_name)
-            self.emulator.load_state(save_path)
+            async with self._emulator_lock:
+                self.emulator.load_state(save_path)
+            self._last_posted_hash = None  # Force the next update to post
 
             embed = create_embed(
                 "📂 State Loaded", f"Loaded game state: **{save_name}**", discord.Color.blue()
@@ -481,4 +633,6 @@ async def run_bot():
     finally:
         if bot.is_running:
             await bot._stop_game()
+        if bot.frame_server:
+            await bot.frame_server.stop()
         await bot.close()
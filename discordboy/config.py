@@ -2,6 +2,7 @@
 
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 from dotenv import load_dotenv
 
@@ -9,29 +10,33 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _int_env(name: str, default: int) -> int:
+    """Parse an integer environment variable, falling back on bad values."""
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _float_env(name: str, default: float) -> float:
+    """Parse a float environment variable, falling back on bad values."""
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
 class Config:
     """Bot configuration from environment variables and constants."""
 
     # Discord Configuration
     DISCORD_BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
-
-    # Parse GAME_CHANNEL_ID safely
-    _channel_id = os.getenv("GAME_CHANNEL_ID", "0")
-    try:
-        GAME_CHANNEL_ID = int(_channel_id) if _channel_id.isdigit() else 0
-    except (ValueError, AttributeError):
-        GAME_CHANNEL_ID = 0
-
-    # Parse ADMIN_ROLE_ID safely
-    _admin_role = os.getenv("ADMIN_ROLE_ID")
-    if _admin_role and _admin_role.isdigit():
-        ADMIN_ROLE_ID = int(_admin_role)
-    else:
-        ADMIN_ROLE_ID = None
+    GAME_CHANNEL_ID = _int_env("GAME_CHANNEL_ID", 0)
+    ADMIN_ROLE_ID = _int_env("ADMIN_ROLE_ID", 0) or None
 
     # Game Configuration
-    UPDATE_INTERVAL = float(os.getenv("UPDATE_INTERVAL", "2.0"))
-    GAME_SPEED = int(os.getenv("GAME_SPEED", "1"))
+    UPDATE_INTERVAL = _float_env("UPDATE_INTERVAL", 2.0)
+    GAME_SPEED = _int_env("GAME_SPEED", 1)
     DEFAULT_ROM = os.getenv("DEFAULT_ROM", "game.gb")
     INPUT_DRIVEN = os.getenv("INPUT_DRIVEN", "true").lower() == "true"  # Only update on input
 
@@ -43,20 +48,35 @@ class Config:
     # Emulator Settings
     SCREEN_SCALE = 3  # Scale Game Boy screen 3x (160x144 -> 480x432)
     TICKS_PER_UPDATE = 60 * 2  # 60 FPS * 2 seconds default
-
-    # Emoji to Button Mappings
-    EMOJI_TO_BUTTON = {
-        "⬆️": "up",
-        "⬇️": "down",
-        "⬅️": "left",
-        "➡️": "right",
-        "🅰️": "a",
-        "🅱️": "b",
-        "▶️": "start",
-        "⏸️": "select",
-    }
-
-    CONTROL_EMOJIS = list(EMOJI_TO_BUTTON.keys())
+    TICKS_PER_UPDATE_SCALED = TICKS_PER_UPDATE * GAME_SPEED  # Kept in sync by set_game_speed
+
+    # Screenshot Settings
+    SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "WEBP").upper()  # WEBP or PNG
+    WEBP_LOSSLESS = os.getenv("WEBP_LOSSLESS", "false").lower() == "true"
+    SCREENSHOT_COMPRESS_LEVEL = _int_env("SCREENSHOT_COMPRESS_LEVEL", 1)  # zlib 0-9
+    PNG_BACKEND = os.getenv("PNG_BACKEND", "auto").lower()  # auto, pyvips or pillow
+
+    # Frame Server (optional) - when PUBLIC_BASE_URL is set to an
+    # internet-reachable address, screen updates edit an embed image URL
+    # instead of re-uploading the screenshot as an attachment
+    PUBLIC_BASE_URL = os.getenv("PUBLIC_BASE_URL", "")
+    FRAME_SERVER_PORT = _int_env("FRAME_SERVER_PORT", 8080)
+
+    # Emoji to Button Mappings (read-only so the hot path can't be mutated)
+    EMOJI_TO_BUTTON = MappingProxyType(
+        {
+            "⬆️": "up",
+            "⬇️": "down",
+            "⬅️": "left",
+            "➡️": "right",
+            "🅰️": "a",
+            "🅱️": "b",
+            "▶️": "start",
+            "⏸️": "select",
+        }
+    )
+
+    CONTROL_EMOJIS = tuple(EMOJI_TO_BUTTON)
 
     # Input Settings
     BUTTON_HOLD_DURATION = 0.1  # Seconds to hold a button press
@@ -77,6 +97,21 @@ class Config:
         cls.GAMES_DIR.mkdir(exist_ok=True)
         cls.SAVES_DIR.mkdir(exist_ok=True)
 
+    @classmethod
+    def set_game_speed(cls, speed: int):
+        """Update the game speed and the derived per-update tick count.
+
+        Precomputing the scaled tick count here means the game loop reads a
+        single attribute instead of multiplying every iteration.
+        """
+        cls.GAME_SPEED = speed
+        cls.TICKS_PER_UPDATE_SCALED = cls.TICKS_PER_UPDATE * speed
+
+    @classmethod
+    def screenshot_filename(cls, base: str = "game") -> str:
+        """Get the upload filename matching the configured screenshot format."""
+        return f"{base}.{cls.SCREENSHOT_FORMAT.lower()}"
+
     @classmethod
     def get_rom_path(cls, rom_name: str) -> Path:
         """Get full path to a ROM file."""
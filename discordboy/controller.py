@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import time
+from collections import OrderedDict
 
 import discord
 
@@ -11,43 +12,57 @@ from discordboy.emulator import GameBoyEmulator
 
 logger = logging.getLogger(__name__)
 
+# Bounds for the per-user rate-limit table so it stays O(active users)
+# over long sessions instead of growing with every user ever seen
+RATE_LIMIT_MAX_USERS = 1024
+RATE_LIMIT_TRIM_TO = 512
+
 
 class InputController:
     """Handles input processing from Discord reactions to Game Boy controls."""
 
-    def __init__(self, emulator: GameBoyEmulator, update_callback=None):
+    def __init__(self, emulator: GameBoyEmulator, update_callback=None, emulator_lock=None):
         """Initialize the input controller.
 
         Args:
             emulator: GameBoyEmulator instance to send inputs to
             update_callback: Optional async callback to trigger screen updates
+            emulator_lock: Optional asyncio.Lock shared with whoever else
+                drives the emulator (e.g. the bot's tick loop); one is
+                created locally if not provided
         """
         self.emulator = emulator
-        self.input_queue: asyncio.Queue = asyncio.Queue()
-        self.user_last_input: dict[int, float] = {}  # Track rate limiting per user
-        self.processing_task: asyncio.Task | None = None
+        # PyBoy is not thread-safe; concurrent press tasks (and the bot's
+        # threaded ticks) must not touch it at the same time
+        self._emulator_lock = emulator_lock or asyncio.Lock()
+        # LRU-ordered rate-limit tracking per user (most recent input last)
+        self.user_last_input: OrderedDict[int, float] = OrderedDict()
         self.is_running = False
         self.update_callback = update_callback
+        self._inflight_tasks: set[asyncio.Task] = set()
+        # Flat button -> (press, release) PyBoy event table so the hot path
+        # sends raw input events without re-walking BUTTON_MAP per press
+        self._button_events: dict[str, tuple] = dict(GameBoyEmulator.BUTTON_MAP)
 
     async def start(self):
-        """Start the input processing task."""
+        """Start accepting inputs."""
         if self.is_running:
             logger.warning("Input controller already running")
             return
 
         self.is_running = True
-        self.processing_task = asyncio.create_task(self._process_queue())
         logger.info("Input controller started")
 
     async def stop(self):
-        """Stop the input processing task."""
+        """Stop accepting inputs and cancel any in-flight button presses."""
         self.is_running = False
-        if self.processing_task:
-            self.processing_task.cancel()
+        for task in list(self._inflight_tasks):
+            task.cancel()
             try:
-                await self.processing_task
+                await task
             except asyncio.CancelledError:
                 pass
+        self._inflight_tasks.clear()
         logger.info("Input controller stopped")
 
     async def handle_reaction(self, emoji: str, user: discord.User):
@@ -62,76 +77,79 @@ class InputController:
             return
 
         # Check if emoji is a valid control
-        if emoji not in Config.EMOJI_TO_BUTTON:
+        button = Config.EMOJI_TO_BUTTON.get(emoji)
+        if button is None:
             logger.debug(f"Invalid emoji: {emoji}")
             return
 
-        # Rate limiting per user
-        current_time = time.time()
+        # Rate limiting per user (monotonic clock is immune to wall-clock jumps)
+        current_time = time.monotonic()
         user_id = user.id
 
-        if user_id in self.user_last_input:
-            time_since_last = current_time - self.user_last_input[user_id]
-            if time_since_last < Config.INPUT_RATE_LIMIT:
-                logger.debug(f"Rate limited user {user.name}")
-                return
+        if current_time - self.user_last_input.get(user_id, 0.0) < Config.INPUT_RATE_LIMIT:
+            logger.debug(f"Rate limited user {user.name}")
+            return
 
-        # Update last input time and queue the input
+        # Update last input time, keeping the table LRU-ordered and bounded
         self.user_last_input[user_id] = current_time
-        await self.input_queue.put((emoji, user))
-        logger.debug(f"Queued input {emoji} from {user.name}")
-
-    async def _process_queue(self):
-        """Process inputs from the queue (runs in background task)."""
-        logger.info("Started input queue processor")
+        self.user_last_input.move_to_end(user_id)
+        if len(self.user_last_input) > RATE_LIMIT_MAX_USERS:
+            while len(self.user_last_input) > RATE_LIMIT_TRIM_TO:
+                self.user_last_input.popitem(last=False)
 
-        while self.is_running:
-            try:
-                # Wait for next input with timeout
-                emoji, user = await asyncio.wait_for(self.input_queue.get(), timeout=1.0)
-                await self._process_input(emoji, user)
-            except asyncio.TimeoutError:
-                # No input received, continue loop
-                continue
-            except asyncio.CancelledError:
-                logger.info("Input processor cancelled")
-                break
-            except Exception as e:
-                logger.error(f"Error processing input: {e}")
-                await asyncio.sleep(0.1)
+        # Press the button directly - for a single-emulator pipeline there
+        # is no need for a queue+worker hop
+        task = asyncio.create_task(self._press_and_release(button, user))
+        self._inflight_tasks.add(task)
+        task.add_done_callback(self._inflight_tasks.discard)
+        logger.debug(f"Dispatched input {button} from {user.name}")
 
-    async def _process_input(self, emoji: str, user: discord.User):
-        """Process a single input.
+    async def _press_and_release(self, button: str, user: discord.User):
+        """Press and release a single button.
 
         Args:
-            emoji: The emoji to process
+            button: Resolved Game Boy button name
             user: User who sent the input
         """
         try:
-            # Map emoji to button
-            button = Config.EMOJI_TO_BUTTON.get(emoji)
-            if not button:
-                return
-
-            # Press button
-            self.emulator.press_button(button)
-            logger.info(f"{user.name} pressed {button}")
-
-            # Hold for configured duration
-            await asyncio.sleep(Config.BUTTON_HOLD_DURATION)
-
-            # Release button
-            self.emulator.release_button(button)
+            # Send the precomputed press/release events straight to PyBoy,
+            # falling back to the validated wrapper for unknown buttons.
+            # Each send_input takes the emulator lock on its own: holding it
+            # across the sleep would block ticks for the whole hold, and the
+            # game only sees the press if a tick runs before the release.
+            events = self._button_events.get(button)
+            pyboy = self.emulator.pyboy
+
+            if events and pyboy:
+                press_event, release_event = events
+                async with self._emulator_lock:
+                    pyboy.send_input(press_event)
+                logger.info(f"{user.name} pressed {button}")
+
+                # Hold for configured duration
+                await asyncio.sleep(Config.BUTTON_HOLD_DURATION)
+
+                async with self._emulator_lock:
+                    pyboy.send_input(release_event)
+            else:
+                async with self._emulator_lock:
+                    self.emulator.press_button(button)
+                logger.info(f"{user.name} pressed {button}")
+
+                # Hold for configured duration
+                await asyncio.sleep(Config.BUTTON_HOLD_DURATION)
+
+                async with self._emulator_lock:
+                    self.emulator.release_button(button)
 
             # Trigger screen update if in input-driven mode
             if Config.INPUT_DRIVEN and self.update_callback:
                 await self.update_callback()
 
-            # Small delay between inputs
-            await asyncio.sleep(0.05)
-
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Error processing input {emoji}: {e}")
+            logger.error(f"Error processing input {button}: {e}")
 
     def clear_rate_limits(self):
         """Clear rate limiting data (useful for testing or reset)."""
@@ -139,9 +157,9 @@ class InputController:
         logger.info("Cleared rate limit data")
 
     def get_queue_size(self) -> int:
-        """Get current input queue size.
+        """Get the number of inputs currently being processed.
 
         Returns:
-            Number of inputs waiting in queue
+            Number of in-flight button presses
         """
-        return self.input_queue.qsize()
+        return len(self._inflight_tasks)
@@ -1,5 +1,6 @@
 """PyBoy emulator wrapper for Game Boy emulation."""
 
+import inspect
 import logging
 from pathlib import Path
 
@@ -25,6 +26,10 @@ class GameBoyEmulator:
         "select": (WindowEvent.PRESS_BUTTON_SELECT, WindowEvent.RELEASE_BUTTON_SELECT),
     }
 
+    # Flattened lookups so the hot input path is a single dict.get
+    _PRESS = {button: events[0] for button, events in BUTTON_MAP.items()}
+    _RELEASE = {button: events[1] for button, events in BUTTON_MAP.items()}
+
     def __init__(self, rom_path: Path, speed: int = 1):
         """Initialize the Game Boy emulator.
 
@@ -50,6 +55,14 @@ class GameBoyEmulator:
                 window="headless",
             )
             self.pyboy.set_emulation_speed(self.speed)
+
+            # PyBoy 2.x runs tick(count) entirely in C; older versions need
+            # a Python loop per frame
+            try:
+                self._tick_batched = "count" in inspect.signature(self.pyboy.tick).parameters
+            except (TypeError, ValueError):
+                self._tick_batched = False
+
             logger.info(f"Initialized emulator with ROM: {self.rom_path.name}")
         except Exception as e:
             logger.error(f"Failed to initialize emulator: {e}")
@@ -64,8 +77,15 @@ class GameBoyEmulator:
         if not self.pyboy:
             raise RuntimeError("Emulator not initialized")
 
-        for _ in range(count):
-            self.pyboy.tick()
+        if self._tick_batched:
+            # Only the final frame of a batch is ever shown, so skip the
+            # PPU compositing work on the intermediate ones
+            if count > 1:
+                self.pyboy.tick(count - 1, False)
+            self.pyboy.tick(1, True)
+        else:
+            for _ in range(count):
+                self.pyboy.tick()
 
     def press_button(self, button: str):
         """Press a Game Boy button.
@@ -76,11 +96,10 @@ class GameBoyEmulator:
         if not self.pyboy:
             raise RuntimeError("Emulator not initialized")
 
-        button = button.lower()
-        if button not in self.BUTTON_MAP:
+        press_event = self._PRESS.get(button.lower())
+        if press_event is None:
             raise ValueError(f"Invalid button: {button}")
 
-        press_event, _ = self.BUTTON_MAP[button]
         self.pyboy.send_input(press_event)
         logger.debug(f"Pressed button: {button}")
 
@@ -93,11 +112,10 @@ class GameBoyEmulator:
         if not self.pyboy:
             raise RuntimeError("Emulator not initialized")
 
-        button = button.lower()
-        if button not in self.BUTTON_MAP:
+        release_event = self._RELEASE.get(button.lower())
+        if release_event is None:
             raise ValueError(f"Invalid button: {button}")
 
-        _, release_event = self.BUTTON_MAP[button]
         self.pyboy.send_input(release_event)
         logger.debug(f"Released button: {button}")
 
@@ -114,6 +132,31 @@ class GameBoyEmulator:
         screen_image = self.pyboy.screen.image
         return screen_image
 
+    def get_frame(self):
+        """Get the current screen as a numpy array.
+
+        Returns a zero-copy view into PyBoy's internal 144x160x4 RGBA
+        framebuffer - no PIL Image construction or pixel copy. Callers must
+        copy the data if they need it to survive the next tick.
+
+        Returns:
+            numpy.ndarray view of the current frame
+        """
+        if not self.pyboy:
+            raise RuntimeError("Emulator not initialized")
+
+        return self.pyboy.screen.ndarray
+
+    def get_frame_bytes(self) -> bytes:
+        """Get the raw framebuffer contents as bytes.
+
+        Useful for cheap frame-change detection without encoding an image.
+
+        Returns:
+            Raw RGBA pixel bytes of the current 160x144 frame
+        """
+        return self.get_frame().tobytes()
+
     def save_state(self, path: Path):
         """Save emulator state to file.
 
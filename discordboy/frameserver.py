@@ -0,0 +1,87 @@
+"""In-process HTTP server exposing the latest frame for embed URL updates."""
+
+import logging
+
+from aiohttp import web
+
+from discordboy.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class FrameServer:
+    """Serves the most recently encoded frame over HTTP.
+
+    When Config.PUBLIC_BASE_URL points at an internet-reachable address,
+    the bot can update the game message by editing an embed image URL (a
+    tiny JSON PATCH) instead of re-uploading the full screenshot as an
+    attachment every frame.
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int | None = None):
+        """Initialize the frame server.
+
+        Args:
+            host: Interface to bind to
+            port: Port to listen on (defaults to Config.FRAME_SERVER_PORT)
+        """
+        self.host = host
+        self.port = port if port is not None else Config.FRAME_SERVER_PORT
+        self._latest_frame: bytes = b""
+        self._content_type = "image/webp"
+        self._runner: web.AppRunner | None = None
+
+    def update_frame(self, data: bytes, content_type: str):
+        """Publish a new frame.
+
+        Args:
+            data: Encoded image bytes
+            content_type: MIME type of the encoded image
+        """
+        self._latest_frame = data
+        self._content_type = content_type
+
+    def frame_url(self, cache_bust: int) -> str:
+        """Build the public URL for the current frame.
+
+        Args:
+            cache_bust: Value appended as a query string so Discord's CDN
+                fetches the new frame instead of serving a cached one
+
+        Returns:
+            Publicly reachable frame URL
+        """
+        return f"{Config.PUBLIC_BASE_URL.rstrip('/')}/frame?t={cache_bust}"
+
+    async def start(self):
+        """Start serving frames."""
+        if self._runner:
+            logger.warning("Frame server already running")
+            return
+
+        app = web.Application()
+        app.router.add_get("/frame", self._handle_frame)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        logger.info(f"Frame server listening on {self.host}:{self.port}")
+
+    async def stop(self):
+        """Stop the server and release the socket."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+            logger.info("Frame server stopped")
+
+    async def _handle_frame(self, request: web.Request) -> web.Response:
+        """Serve the latest frame bytes."""
+        if not self._latest_frame:
+            raise web.HTTPNotFound(reason="No frame available")
+
+        return web.Response(
+            body=self._latest_frame,
+            content_type=self._content_type,
+            headers={"Cache-Control": "no-store"},
+        )
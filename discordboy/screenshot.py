@@ -1,43 +1,190 @@
 """Screenshot capture and processing for Discord."""
 
+import asyncio
+import functools
 import io
 import logging
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from discordboy.config import Config
 from discordboy.emulator import GameBoyEmulator
 
+# Optional SIMD-accelerated PNG encoder; Pillow remains the fallback
+try:
+    import pyvips as _pyvips
+except ImportError:
+    _pyvips = None
+
 logger = logging.getLogger(__name__)
 
+# Small free list of BytesIO buffers reused across frames to avoid
+# allocating a fresh buffer (and its encoded payload) every update
+_BUF_POOL_SIZE = 4
+_buf_pool: list[io.BytesIO] = []
+
+
+def _acquire_buffer() -> io.BytesIO:
+    """Get a cleared buffer from the pool, or a new one if empty."""
+    if _buf_pool:
+        buffer = _buf_pool.pop()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return buffer
+    return io.BytesIO()
+
+
+def recycle_buffer(buffer: io.BytesIO):
+    """Return a screenshot buffer to the pool once its upload completed.
+
+    Args:
+        buffer: Buffer previously returned by capture_screenshot or
+            create_error_image
+    """
+    if len(_buf_pool) < _BUF_POOL_SIZE:
+        _buf_pool.append(buffer)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_font(name: str, size: int) -> ImageFont.ImageFont:
+    """Load a font once and cache it; truetype parses the file each call."""
+    try:
+        return ImageFont.truetype(name, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=64)
+def _render_overlay_sprite(text: str, font_size: int) -> Image.Image:
+    """Render overlay text onto a small RGBA sprite, cached per string.
+
+    Overlay text is usually constant across many frames; rendering it once
+    reduces each overlay to a single alpha-composited paste.
+    """
+    font = _get_font("arial.ttf", font_size)
+    measure = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    bbox = measure.textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    # Sprite covers the text plus the 5px background margin on each side
+    sprite = Image.new("RGBA", (text_width + 10, text_height + 10))
+    draw = ImageDraw.Draw(sprite)
+    draw.rectangle([0, 0, sprite.width - 1, sprite.height - 1], fill=(0, 0, 0, 180))
+    draw.text((5 - bbox[0], 5 - bbox[1]), text, fill=(255, 255, 255), font=font)
+    return sprite
+
+
+@functools.lru_cache(maxsize=64)
+def _overlay_sprite_arrays(text: str, font_size: int) -> tuple:
+    """Split the cached overlay sprite into numpy color/alpha planes.
+
+    Widened to uint16 once here so the per-frame alpha blend needs no
+    intermediate conversions.
+    """
+    sprite = np.asarray(_render_overlay_sprite(text, font_size), dtype=np.uint16)
+    return sprite[:, :, :3], sprite[:, :, 3:]
 
-async def capture_screenshot(emulator: GameBoyEmulator, overlay_text: str = None) -> io.BytesIO:
+
+def save_image(image: Image.Image, buffer: io.BytesIO):
+    """Save an image to a buffer in the configured screenshot format.
+
+    WebP encodes 2-10x smaller and roughly twice as fast as PNG for the
+    scaled Game Boy frame; PNG remains available via Config.SCREENSHOT_FORMAT.
+
+    Args:
+        image: PIL Image to encode
+        buffer: Buffer to write encoded image data into
+    """
+    if Config.SCREENSHOT_FORMAT == "WEBP":
+        if Config.WEBP_LOSSLESS:
+            image.save(buffer, format="WEBP", lossless=True, quality=100, method=0)
+        else:
+            image.save(buffer, format="WEBP", quality=90, method=4)
+    else:
+        # Drop any alpha channel first so the encoder skips the alpha pass
+        if image.mode not in ("RGB", "P"):
+            image = image.convert("RGB")
+
+        # libvips encodes PNG with SIMD and no per-row filter search; use
+        # it when installed unless explicitly pinned to Pillow
+        if _pyvips is not None and Config.PNG_BACKEND != "pillow" and image.mode == "RGB":
+            vips_image = _pyvips.Image.new_from_memory(
+                np.asarray(image).tobytes(), image.width, image.height, 3, "uchar"
+            )
+            buffer.write(
+                vips_image.pngsave_buffer(
+                    compression=Config.SCREENSHOT_COMPRESS_LEVEL, filter="none"
+                )
+            )
+            return
+
+        # Game Boy output uses at most a few dozen colors, so an 8-bit
+        # paletted PNG halves the zlib input with no visible loss, and a
+        # low compress_level trades a little size for a much faster encode
+        if image.mode == "RGB":
+            image = image.convert("P", palette=Image.ADAPTIVE)
+        image.save(
+            buffer,
+            format="PNG",
+            compress_level=Config.SCREENSHOT_COMPRESS_LEVEL,
+            optimize=False,
+        )
+
+
+async def capture_screenshot(
+    emulator: GameBoyEmulator, overlay_text: str = None, frame=None
+) -> io.BytesIO:
     """Capture screenshot from emulator and prepare for Discord upload.
 
     Args:
         emulator: GameBoyEmulator instance
         overlay_text: Optional text to overlay on the image
+        frame: Optional pre-captured RGBA framebuffer snapshot; when given,
+            the live framebuffer is not read again, so the encoded image
+            matches whatever the caller hashed or inspected
 
     Returns:
-        BytesIO buffer containing PNG image data
+        BytesIO buffer containing encoded image data in the configured
+        screenshot format
     """
     try:
-        # Get current screen from emulator
-        image = emulator.get_screenshot()
+        # Get current screen as a zero-copy view into PyBoy's framebuffer,
+        # dropping the constant alpha channel before any bytes move
+        if frame is None:
+            frame = emulator.get_frame()
+        arr = frame[:, :, :3]
 
         # Scale up using nearest neighbor to keep pixels sharp
-        # Game Boy screen is 160x144, we scale by 3x to 480x432
-        scaled_width = image.width * Config.SCREEN_SCALE
-        scaled_height = image.height * Config.SCREEN_SCALE
-        scaled_image = image.resize((scaled_width, scaled_height), Image.NEAREST)
-
-        # Add overlay if provided
+        # Game Boy screen is 160x144, we scale by 3x to 480x432.
+        # For integer factors np.repeat is a pure memcpy pattern and avoids
+        # Pillow's generic resample pipeline (it also copies, detaching us
+        # from the live framebuffer view).
+        scale = Config.SCREEN_SCALE
+        arr = np.repeat(np.repeat(arr, scale, axis=0), scale, axis=1)
+
+        # Blend the overlay sprite while the frame is still an ndarray,
+        # instead of a separate PIL draw pass over the upscaled buffer
         if overlay_text:
-            scaled_image = add_overlay(scaled_image, overlay_text)
-
-        # Convert to BytesIO for Discord upload
-        buffer = io.BytesIO()
-        scaled_image.save(buffer, format="PNG")
+            sprite_rgb, sprite_alpha = _overlay_sprite_arrays(overlay_text, 16)
+            height, width = sprite_rgb.shape[:2]
+            # Clamp the corner to the frame and crop the sprite to whatever
+            # fits: a long game name can render wider than the frame, and a
+            # negative offset would shrink the region and break the blend
+            x = max(arr.shape[1] - width - 5, 0)
+            y = max(arr.shape[0] - height - 5, 0)
+            region = arr[y : y + height, x : x + width]
+            sprite_rgb = sprite_rgb[: region.shape[0], : region.shape[1]]
+            sprite_alpha = sprite_alpha[: region.shape[0], : region.shape[1]]
+            region[:] = (sprite_rgb * sprite_alpha + region * (255 - sprite_alpha)) // 255
+
+        scaled_image = Image.fromarray(arr)
+
+        # Encode off the event loop: Pillow releases the GIL during
+        # compression, so the heartbeat and input handling keep flowing
+        buffer = _acquire_buffer()
+        await asyncio.to_thread(save_image, scaled_image, buffer)
         buffer.seek(0)
 
         return buffer
@@ -50,42 +197,24 @@ async def capture_screenshot(emulator: GameBoyEmulator, overlay_text: str = None
 def add_overlay(image: Image.Image, text: str) -> Image.Image:
     """Add text overlay to an image.
 
+    Mutates the input image in place; the only caller hands in a freshly
+    scaled frame, so copying the full buffer first would be wasted work.
+
     Args:
-        image: PIL Image to add overlay to
+        image: PIL Image to add overlay to (modified in place)
         text: Text to display
 
     Returns:
         Image with overlay added
     """
     try:
-        # Create a copy to avoid modifying original
-        img_with_overlay = image.copy()
-        draw = ImageDraw.Draw(img_with_overlay)
-
-        # Try to use a nice font, fall back to default if not available
-        try:
-            font = ImageFont.truetype("arial.ttf", 16)
-        except OSError:
-            font = ImageFont.load_default()
-
-        # Calculate text position (bottom right corner with padding)
-        # Use textbbox instead of deprecated textsize
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-
-        padding = 10
-        x = image.width - text_width - padding
-        y = image.height - text_height - padding
-
-        # Draw background rectangle for better readability
-        background_bbox = [x - 5, y - 5, x + text_width + 5, y + text_height + 5]
-        draw.rectangle(background_bbox, fill=(0, 0, 0, 180))
+        # Paste the cached sprite in the bottom right corner with padding
+        sprite = _render_overlay_sprite(text, 16)
+        x = image.width - sprite.width - 5
+        y = image.height - sprite.height - 5
+        image.paste(sprite, (x, y), sprite)
 
-        # Draw text in white
-        draw.text((x, y), text, fill=(255, 255, 255), font=font)
-
-        return img_with_overlay
+        return image
 
     except Exception as e:
         logger.error(f"Error adding overlay: {e}")
@@ -107,14 +236,27 @@ def add_border(
         Image with border added
     """
     try:
-        # Create new image with border
-        new_width = image.width + (border_width * 2)
-        new_height = image.height + (border_width * 2)
-
-        bordered_image = Image.new("RGB", (new_width, new_height), border_color)
-        bordered_image.paste(image, (border_width, border_width))
-
-        return bordered_image
+        # Nothing to draw, and the -bw slices below degenerate at zero
+        # (bordered[-0:] is the whole array)
+        if border_width <= 0:
+            return image
+
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
+        # Build the bordered frame in one numpy allocation: fill only the
+        # border strips, then copy the image into the center, instead of
+        # PIL's fill-everything-then-overwrite Image.new + paste
+        arr = np.asarray(image)
+        bw = border_width
+        bordered = np.empty((arr.shape[0] + bw * 2, arr.shape[1] + bw * 2, 3), dtype=arr.dtype)
+        bordered[:bw] = border_color
+        bordered[-bw:] = border_color
+        bordered[:, :bw] = border_color
+        bordered[:, -bw:] = border_color
+        bordered[bw:-bw, bw:-bw] = arr
+
+        return Image.fromarray(bordered)
 
     except Exception as e:
         logger.error(f"Error adding border: {e}")
@@ -136,11 +278,8 @@ async def create_error_image(error_message: str) -> io.BytesIO:
         image = Image.new("RGB", (width, height), color=(20, 20, 20))
         draw = ImageDraw.Draw(image)
 
-        # Try to load a font
-        try:
-            font = ImageFont.truetype("arial.ttf", 20)
-        except OSError:
-            font = ImageFont.load_default()
+        # Load a font (cached across calls)
+        font = _get_font("arial.ttf", 20)
 
         # Draw error message
         text = f"Error:\n{error_message}"
@@ -155,9 +294,9 @@ async def create_error_image(error_message: str) -> io.BytesIO:
 
         draw.text((x, y), text, fill=(255, 100, 100), font=font)
 
-        # Convert to BytesIO
-        buffer = io.BytesIO()
-        image.save(buffer, format="PNG")
+        # Convert to BytesIO, encoding off the event loop
+        buffer = _acquire_buffer()
+        await asyncio.to_thread(save_image, image, buffer)
         buffer.seek(0)
 
         return buffer
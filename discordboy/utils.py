@@ -1,14 +1,24 @@
 """Helper utility functions for the Discord Game Boy bot."""
 
 import logging
+import os
 from pathlib import Path
-
-import discord
+from typing import TYPE_CHECKING
 
 from discordboy.config import Config
 
+# discord is only needed by a couple of helpers; deferring the import
+# keeps cold start and test collection from paying for the full stack
+if TYPE_CHECKING:
+    import discord
+
 logger = logging.getLogger(__name__)
 
+# Directory scans cached against the directory's mtime; ROM and save
+# folders rarely change, so repeat listings cost a single stat call
+_rom_cache: tuple[tuple, list[str]] | None = None
+_save_cache: tuple[tuple, list[str]] | None = None
+
 
 def load_rom_list() -> list[str]:
     """Scan games directory for available ROM files.
@@ -16,20 +26,27 @@ def load_rom_list() -> list[str]:
     Returns:
         List of ROM filenames
     """
+    global _rom_cache
+
     try:
         if not Config.GAMES_DIR.exists():
             logger.warning(f"Games directory not found: {Config.GAMES_DIR}")
             return []
 
-        # Find all .gb and .gbc files
-        roms = []
-        for extension in ["*.gb", "*.gbc"]:
-            roms.extend(Config.GAMES_DIR.glob(extension))
+        cache_key = (Config.GAMES_DIR, Config.GAMES_DIR.stat().st_mtime_ns)
+        if _rom_cache is not None and _rom_cache[0] == cache_key:
+            return _rom_cache[1]
 
-        # Return just the filenames
-        rom_names = [rom.name for rom in roms]
-        rom_names.sort()
+        # Find all .gb and .gbc files in one scandir pass; cheaper than
+        # two glob walks that build a Path object per entry
+        with os.scandir(Config.GAMES_DIR) as entries:
+            rom_names = sorted(
+                entry.name
+                for entry in entries
+                if entry.is_file() and entry.name.lower().endswith((".gb", ".gbc"))
+            )
 
+        _rom_cache = (cache_key, rom_names)
         logger.info(f"Found {len(rom_names)} ROM(s)")
         return rom_names
 
@@ -70,7 +87,7 @@ def validate_rom(rom_name: str) -> bool:
         return False
 
 
-def is_admin(member: discord.Member) -> bool:
+def is_admin(member: "discord.Member") -> bool:
     """Check if a user has admin permissions.
 
     Args:
@@ -84,13 +101,10 @@ def is_admin(member: discord.Member) -> bool:
         if member.guild_permissions.administrator:
             return True
 
-        # Check for configured admin role
-        if Config.ADMIN_ROLE_ID:
-            admin_role = discord.utils.get(member.roles, id=Config.ADMIN_ROLE_ID)
-            if admin_role:
-                return True
-
-        return False
+        # Check for configured admin role; a direct id comparison avoids
+        # discord.utils.get building an attrgetter per call
+        role_id = Config.ADMIN_ROLE_ID
+        return bool(role_id and any(role.id == role_id for role in member.roles))
 
     except Exception as e:
         logger.error(f"Error checking admin status: {e}")
@@ -126,20 +140,25 @@ def format_game_name(filename: str) -> str:
 def create_embed(
     title: str,
     description: str,
-    color: discord.Color = discord.Color.blue(),
+    color: "discord.Color | None" = None,
     fields: list[tuple] | None = None,
-) -> discord.Embed:
+) -> "discord.Embed":
     """Create a Discord embed message.
 
     Args:
         title: Embed title
         description: Embed description
-        color: Embed color
+        color: Embed color (defaults to blue)
         fields: Optional list of (name, value, inline) tuples
 
     Returns:
         Discord Embed object
     """
+    import discord
+
+    if color is None:
+        color = discord.Color.blue()
+
     embed = discord.Embed(title=title, description=description, color=color)
 
     if fields:
@@ -155,14 +174,24 @@ def get_save_list() -> list[str]:
     Returns:
         List of save state filenames
     """
+    global _save_cache
+
     try:
         if not Config.SAVES_DIR.exists():
             return []
 
-        saves = list(Config.SAVES_DIR.glob("*.state"))
-        save_names = [save.stem for save in saves]  # Remove .state extension
-        save_names.sort()
+        cache_key = (Config.SAVES_DIR, Config.SAVES_DIR.stat().st_mtime_ns)
+        if _save_cache is not None and _save_cache[0] == cache_key:
+            return _save_cache[1]
+
+        with os.scandir(Config.SAVES_DIR) as entries:
+            save_names = sorted(
+                entry.name[: -len(".state")]  # Remove .state extension
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(".state")
+            )
 
+        _save_cache = (cache_key, save_names)
         return save_names
 
     except Exception as e:
@@ -179,16 +208,15 @@ def format_uptime(seconds: float) -> str:
     Returns:
         Formatted uptime string (e.g., "2h 34m 12s")
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, secs = divmod(remainder, 60)
 
     parts = []
-    if hours > 0:
+    if hours:
         parts.append(f"{hours}h")
-    if minutes > 0:
+    if minutes:
         parts.append(f"{minutes}m")
-    if secs > 0 or not parts:
+    if secs or not parts:
         parts.append(f"{secs}s")
 
     return " ".join(parts)
@@ -7,12 +7,12 @@ from unittest.mock import MagicMock, AsyncMock
 import pytest
 from pyboy import PyBoy
 
+from discordboy.emulator import GameBoyEmulator
 
-@pytest.fixture
-def mock_rom_path(tmp_path):
-    """Create a temporary ROM file path for testing."""
-    rom_file = tmp_path / "test_game.gb"
-    # Create a minimal valid Game Boy ROM (must be at least 16KB = 0x4000 bytes)
+
+def _build_rom_data() -> bytes:
+    """Build a minimal valid Game Boy ROM image."""
+    # Must be at least 16KB = 0x4000 bytes
     rom_data = bytearray([0x00] * 0x8000)  # 32KB ROM
     # Add Nintendo logo (required for valid ROM)
     rom_data[0x104:0x134] = [
@@ -30,33 +30,76 @@ def mock_rom_path(tmp_path):
     # Set ROM size to 0x00 (32KB)
     rom_data[0x148] = 0x00
 
-    # Calculate and set header checksum (sum of bytes 0x134-0x14C)
-    checksum = 0
-    for i in range(0x134, 0x14D):
-        checksum = (checksum - rom_data[i] - 1) & 0xFF
-    rom_data[0x14D] = checksum
+    # Calculate and set header checksum (bytes 0x134-0x14C); folding
+    # (checksum - byte - 1) per byte is just the negated sum plus count
+    header = rom_data[0x134:0x14D]
+    rom_data[0x14D] = (-(sum(header) + len(header))) & 0xFF
+
+    return bytes(rom_data)
+
 
-    rom_file.write_bytes(rom_data)
+@pytest.fixture
+def mock_rom_path(tmp_path):
+    """Create a temporary ROM file path for testing."""
+    rom_file = tmp_path / "test_game.gb"
+    rom_file.write_bytes(_build_rom_data())
     return rom_file
 
 
+@pytest.fixture(scope="session")
+def emulator(tmp_path_factory):
+    """Shared emulator instance, booted once per session.
+
+    PyBoy startup (ROM load, CPU/PPU/memory init) dominates the emulator
+    tests; sharing one instance amortizes it. Under pytest-xdist each
+    worker boots its own copy once. Tests that verify construction
+    semantics still boot their own.
+    """
+    rom_file = tmp_path_factory.mktemp("roms") / "test_game.gb"
+    rom_file.write_bytes(_build_rom_data())
+    emu = GameBoyEmulator(rom_file)
+    yield emu
+    emu.close()
+
+
 @pytest.fixture
-def mock_config(tmp_path, monkeypatch):
-    """Mock Config with temporary directories."""
+def fake_emulator(mock_rom_path, monkeypatch):
+    """Emulator backed by a MagicMock PyBoy.
+
+    For tests that exercise GameBoyEmulator's own dispatch and validation
+    logic; skips the ROM-load path entirely.
+    """
+    monkeypatch.setattr("discordboy.emulator.PyBoy", MagicMock())
+    emu = GameBoyEmulator(mock_rom_path)
+    yield emu
+    emu.close()
+
+
+@pytest.fixture(scope="module")
+def mock_config(tmp_path_factory):
+    """Mock Config with temporary directories, patched once per module.
+
+    The built-in monkeypatch fixture is function-scoped, so this uses a
+    manual MonkeyPatch undone at teardown. Tests that need different
+    Config values patch on top with their own monkeypatch.
+    """
     from discordboy import config
 
+    patcher = pytest.MonkeyPatch()
+    tmp_path = tmp_path_factory.mktemp("config")
     games_dir = tmp_path / "games"
     saves_dir = tmp_path / "saves"
     games_dir.mkdir()
     saves_dir.mkdir()
 
-    monkeypatch.setattr(config.Config, "GAMES_DIR", games_dir)
-    monkeypatch.setattr(config.Config, "SAVES_DIR", saves_dir)
-    monkeypatch.setattr(config.Config, "DISCORD_BOT_TOKEN", "test_token_12345")
-    monkeypatch.setattr(config.Config, "GAME_CHANNEL_ID", 123456789)
-    monkeypatch.setattr(config.Config, "ADMIN_ROLE_ID", 987654321)
+    patcher.setattr(config.Config, "GAMES_DIR", games_dir)
+    patcher.setattr(config.Config, "SAVES_DIR", saves_dir)
+    patcher.setattr(config.Config, "DISCORD_BOT_TOKEN", "test_token_12345")
+    patcher.setattr(config.Config, "GAME_CHANNEL_ID", 123456789)
+    patcher.setattr(config.Config, "ADMIN_ROLE_ID", 987654321)
 
-    return config.Config
+    yield config.Config
+    patcher.undo()
 
 
 @pytest.fixture
@@ -4,7 +4,8 @@ import os
 from pathlib import Path
 
 import pytest
-from discordboy.config import Config
+from discordboy import config
+from discordboy.config import Config, _int_env
 
 
 def test_config_has_required_attributes():
@@ -67,8 +68,6 @@ def test_config_validate_success(mock_config):
 
 def test_config_validate_missing_token(monkeypatch):
     """Test config validation fails without bot token."""
-    from discordboy import config
-
     monkeypatch.setattr(config.Config, "DISCORD_BOT_TOKEN", None)
     with pytest.raises(ValueError, match="DISCORD_BOT_TOKEN"):
         config.Config.validate()
@@ -76,8 +75,6 @@ def test_config_validate_missing_token(monkeypatch):
 
 def test_config_validate_missing_channel(monkeypatch):
     """Test config validation fails without channel ID."""
-    from discordboy import config
-
     monkeypatch.setattr(config.Config, "DISCORD_BOT_TOKEN", "test_token")
     monkeypatch.setattr(config.Config, "GAME_CHANNEL_ID", 0)
     with pytest.raises(ValueError, match="GAME_CHANNEL_ID"):
@@ -94,3 +91,22 @@ def test_ticks_per_update_setting():
     """Test ticks per update configuration."""
     assert Config.TICKS_PER_UPDATE == 120  # 60 FPS * 2 seconds
     assert isinstance(Config.TICKS_PER_UPDATE, int)
+
+
+def test_set_game_speed_updates_scaled_ticks(monkeypatch):
+    """Test set_game_speed keeps the derived tick count in sync."""
+    monkeypatch.setattr(Config, "GAME_SPEED", Config.GAME_SPEED)
+    monkeypatch.setattr(Config, "TICKS_PER_UPDATE_SCALED", Config.TICKS_PER_UPDATE_SCALED)
+
+    Config.set_game_speed(4)
+    assert Config.GAME_SPEED == 4
+    assert Config.TICKS_PER_UPDATE_SCALED == Config.TICKS_PER_UPDATE * 4
+
+
+def test_int_env_rejects_garbage(monkeypatch):
+    """Test integer env parsing falls back on non-numeric values."""
+    monkeypatch.setenv("TEST_INT_ENV", "not_a_number")
+    assert _int_env("TEST_INT_ENV", 7) == 7
+
+    monkeypatch.setenv("TEST_INT_ENV", "-5")
+    assert _int_env("TEST_INT_ENV", 7) == -5
@@ -1,223 +1,167 @@
 """Tests for input controller module."""
 
 import asyncio
-import time
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
-from discordboy.controller import InputController
+from discordboy.controller import (
+    RATE_LIMIT_MAX_USERS,
+    RATE_LIMIT_TRIM_TO,
+    InputController,
+)
 from discordboy.config import Config
 
 
+@pytest.fixture
+async def controller(emulator):
+    """Controller wired to the shared emulator, stopped at teardown."""
+    controller = InputController(emulator)
+    yield controller
+    await controller.stop()
+
+
 @pytest.mark.asyncio
-async def test_controller_init(mock_rom_path):
+async def test_controller_init(controller, emulator):
     """Test controller initialization."""
-    from discordboy.emulator import GameBoyEmulator
-
-    emulator = GameBoyEmulator(mock_rom_path)
-    try:
-        controller = InputController(emulator)
-        assert controller.emulator == emulator
-        assert controller.is_running is False
-        assert controller.input_queue.qsize() == 0
-    finally:
-        emulator.close()
+    assert controller.emulator == emulator
+    assert controller.is_running is False
+    assert controller.get_queue_size() == 0
 
 
 @pytest.mark.asyncio
-async def test_controller_start_stop(mock_rom_path):
+async def test_controller_start_stop(controller):
     """Test starting and stopping controller."""
-    from discordboy.emulator import GameBoyEmulator
-
-    emulator = GameBoyEmulator(mock_rom_path)
-    try:
-        controller = InputController(emulator)
-
-        await controller.start()
-        assert controller.is_running is True
-        assert controller.processing_task is not None
+    await controller.start()
+    assert controller.is_running is True
 
-        await controller.stop()
-        assert controller.is_running is False
-    finally:
-        emulator.close()
+    await controller.stop()
+    assert controller.is_running is False
 
 
 @pytest.mark.asyncio
-async def test_controller_handle_reaction_valid_emoji(mock_rom_path, mock_discord_user):
+async def test_controller_handle_reaction_valid_emoji(controller, mock_discord_user):
     """Test handling valid emoji reaction."""
-    from discordboy.emulator import GameBoyEmulator
+    await controller.start()
 
-    emulator = GameBoyEmulator(mock_rom_path)
-    try:
-        controller = InputController(emulator)
-        await controller.start()
+    await controller.handle_reaction("⬆️", mock_discord_user)
+    assert controller.get_queue_size() == 1  # Press dispatched
 
-        await controller.handle_reaction("⬆️", mock_discord_user)
-        await asyncio.sleep(0.1)  # Allow processing
-
-        assert controller.input_queue.qsize() >= 0  # Queue should be processing
-        await controller.stop()
-    finally:
-        emulator.close()
+    await asyncio.sleep(Config.BUTTON_HOLD_DURATION + 0.1)  # Allow processing
+    assert controller.get_queue_size() == 0  # Press completed
 
 
 @pytest.mark.asyncio
-async def test_controller_ignore_bot_reactions(mock_rom_path):
+async def test_controller_ignore_bot_reactions(controller):
     """Test that bot reactions are ignored."""
-    from discordboy.emulator import GameBoyEmulator
-
-    emulator = GameBoyEmulator(mock_rom_path)
     bot_user = MagicMock()
     bot_user.bot = True
     bot_user.id = 999999
 
-    try:
-        controller = InputController(emulator)
-        initial_queue_size = controller.input_queue.qsize()
-
-        await controller.handle_reaction("⬆️", bot_user)
+    await controller.handle_reaction("⬆️", bot_user)
 
-        # Queue should not change
-        assert controller.input_queue.qsize() == initial_queue_size
-    finally:
-        emulator.close()
+    # No input should be dispatched
+    assert controller.get_queue_size() == 0
 
 
 @pytest.mark.asyncio
-async def test_controller_invalid_emoji(mock_rom_path, mock_discord_user):
+async def test_controller_invalid_emoji(controller, mock_discord_user):
     """Test handling invalid emoji."""
-    from discordboy.emulator import GameBoyEmulator
-
-    emulator = GameBoyEmulator(mock_rom_path)
-    try:
-        controller = InputController(emulator)
-        initial_queue_size = controller.input_queue.qsize()
-
-        await controller.handle_reaction("❌", mock_discord_user)
+    await controller.handle_reaction("❌", mock_discord_user)
 
-        # Invalid emoji should not be queued
-        assert controller.input_queue.qsize() == initial_queue_size
-    finally:
-        emulator.close()
+    # Invalid emoji should not be dispatched
+    assert controller.get_queue_size() == 0
 
 
 @pytest.mark.asyncio
-async def test_controller_rate_limiting(mock_rom_path, mock_discord_user):
+async def test_controller_rate_limiting(controller, mock_discord_user):
     """Test rate limiting per user."""
-    from discordboy.emulator import GameBoyEmulator
+    # First input should be accepted
+    await controller.handle_reaction("⬆️", mock_discord_user)
+    first_size = controller.get_queue_size()
 
-    emulator = GameBoyEmulator(mock_rom_path)
-    try:
-        controller = InputController(emulator)
+    # Second input immediately after should be rate limited
+    await controller.handle_reaction("⬇️", mock_discord_user)
+    second_size = controller.get_queue_size()
 
-        # First input should be accepted
-        await controller.handle_reaction("⬆️", mock_discord_user)
-        first_queue_size = controller.input_queue.qsize()
-
-        # Second input immediately after should be rate limited
-        await controller.handle_reaction("⬇️", mock_discord_user)
-        second_queue_size = controller.input_queue.qsize()
-
-        # Queue size should not increase due to rate limit
-        assert second_queue_size == first_queue_size
-    finally:
-        emulator.close()
+    # No extra input should be dispatched due to rate limit
+    assert second_size == first_size
 
 
 @pytest.mark.asyncio
-async def test_controller_update_callback(mock_rom_path):
+async def test_controller_update_callback(emulator):
     """Test update callback is triggered."""
-    from discordboy.emulator import GameBoyEmulator
-
-    emulator = GameBoyEmulator(mock_rom_path)
     callback_called = False
 
     async def update_callback():
         nonlocal callback_called
         callback_called = True
 
-    try:
-        controller = InputController(emulator, update_callback)
-        await controller.start()
+    controller = InputController(emulator, update_callback)
+    await controller.start()
 
-        # Manually process an input
-        user = MagicMock()
-        user.id = 12345
-        user.name = "TestUser"
-        user.bot = False
+    # Manually process an input
+    user = MagicMock()
+    user.id = 12345
+    user.name = "TestUser"
+    user.bot = False
 
-        await controller._process_input("⬆️", user)
+    await controller._press_and_release("up", user)
 
-        # In INPUT_DRIVEN mode, callback should be called
-        if Config.INPUT_DRIVEN:
-            await asyncio.sleep(0.2)  # Wait for callback
-            assert callback_called is True
+    # In INPUT_DRIVEN mode, callback should be called
+    if Config.INPUT_DRIVEN:
+        assert callback_called is True
 
-        await controller.stop()
-    finally:
-        emulator.close()
+    await controller.stop()
 
 
 @pytest.mark.asyncio
-async def test_controller_clear_rate_limits(mock_rom_path, mock_discord_user):
+async def test_controller_clear_rate_limits(controller, mock_discord_user):
     """Test clearing rate limit data."""
-    from discordboy.emulator import GameBoyEmulator
+    await controller.handle_reaction("⬆️", mock_discord_user)
+    assert len(controller.user_last_input) > 0
 
-    emulator = GameBoyEmulator(mock_rom_path)
-    try:
-        controller = InputController(emulator)
+    controller.clear_rate_limits()
+    assert len(controller.user_last_input) == 0
 
-        await controller.handle_reaction("⬆️", mock_discord_user)
-        assert len(controller.user_last_input) > 0
 
-        controller.clear_rate_limits()
-        assert len(controller.user_last_input) == 0
-    finally:
-        emulator.close()
+@pytest.mark.asyncio
+async def test_controller_rate_limit_table_bounded(controller, mock_discord_user):
+    """Test rate limit table is trimmed once it exceeds the cap."""
+    # Pre-fill the table past the cap with stale entries
+    for user_id in range(RATE_LIMIT_MAX_USERS + 1):
+        controller.user_last_input[user_id] = 0.0
 
+    await controller.handle_reaction("⬆️", mock_discord_user)
 
-@pytest.mark.asyncio
-async def test_controller_get_queue_size(mock_rom_path, mock_discord_user):
-    """Test getting queue size."""
-    from discordboy.emulator import GameBoyEmulator
+    assert len(controller.user_last_input) <= RATE_LIMIT_TRIM_TO
+    assert mock_discord_user.id in controller.user_last_input
 
-    emulator = GameBoyEmulator(mock_rom_path)
-    try:
-        controller = InputController(emulator)
 
-        initial_size = controller.get_queue_size()
-        await controller.handle_reaction("⬆️", mock_discord_user)
+@pytest.mark.asyncio
+async def test_controller_get_queue_size(controller, mock_discord_user):
+    """Test getting queue size."""
+    initial_size = controller.get_queue_size()
+    await controller.handle_reaction("⬆️", mock_discord_user)
 
-        # Queue size should be trackable
-        assert controller.get_queue_size() >= initial_size
-    finally:
-        emulator.close()
+    # In-flight input count should be trackable
+    assert controller.get_queue_size() >= initial_size
 
 
 @pytest.mark.asyncio
-async def test_controller_multiple_users(mock_rom_path):
+async def test_controller_multiple_users(controller):
     """Test multiple users can send inputs."""
-    from discordboy.emulator import GameBoyEmulator
-
-    emulator = GameBoyEmulator(mock_rom_path)
-    try:
-        controller = InputController(emulator)
-
-        user1 = MagicMock()
-        user1.id = 1
-        user1.bot = False
+    user1 = MagicMock()
+    user1.id = 1
+    user1.bot = False
 
-        user2 = MagicMock()
-        user2.id = 2
-        user2.bot = False
+    user2 = MagicMock()
+    user2.id = 2
+    user2.bot = False
 
-        # Both users should be able to queue inputs
-        await controller.handle_reaction("⬆️", user1)
-        await controller.handle_reaction("⬇️", user2)
+    # Both users should be able to send inputs
+    await controller.handle_reaction("⬆️", user1)
+    await controller.handle_reaction("⬇️", user2)
 
-        # Both should be in rate limit tracking
-        assert user1.id in controller.user_last_input
-        assert user2.id in controller.user_last_input
-    finally:
-        emulator.close()
+    # Both should be in rate limit tracking
+    assert user1.id in controller.user_last_input
+    assert user2.id in controller.user_last_input
@@ -0,0 +1,50 @@
+"""Tests for frame server module."""
+
+import aiohttp
+import pytest
+
+from discordboy.config import Config
+from discordboy.frameserver import FrameServer
+
+
+def test_update_frame_stores_latest():
+    """Test frames replace each other as they are published."""
+    server = FrameServer()
+
+    server.update_frame(b"frame1", "image/webp")
+    server.update_frame(b"frame2", "image/png")
+
+    assert server._latest_frame == b"frame2"
+    assert server._content_type == "image/png"
+
+
+def test_frame_url_cache_busting(monkeypatch):
+    """Test frame URL uses the public base and a cache-bust query."""
+    monkeypatch.setattr(Config, "PUBLIC_BASE_URL", "http://example.com:8080/")
+
+    server = FrameServer()
+    assert server.frame_url(12345) == "http://example.com:8080/frame?t=12345"
+
+
+@pytest.mark.asyncio
+async def test_frame_server_serves_latest_frame():
+    """Test the HTTP endpoint returns the published frame."""
+    server = FrameServer(host="127.0.0.1", port=0)
+    await server.start()
+
+    try:
+        host, port = server._runner.addresses[0][:2]
+        url = f"http://{host}:{port}/frame"
+
+        async with aiohttp.ClientSession() as session:
+            # No frame published yet
+            async with session.get(url) as response:
+                assert response.status == 404
+
+            server.update_frame(b"frame-bytes", "image/webp")
+            async with session.get(url) as response:
+                assert response.status == 200
+                assert await response.read() == b"frame-bytes"
+                assert response.content_type == "image/webp"
+    finally:
+        await server.stop()
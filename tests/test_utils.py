@@ -1,7 +1,10 @@
 """Tests for utils module."""
 
+import discord
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock
+from discordboy import config
 from discordboy.utils import (
     format_game_name,
     format_uptime,
@@ -9,13 +12,33 @@ from discordboy.utils import (
     create_embed,
 )
 
+_BLUE = discord.Color.blue()
 
-def test_format_game_name():
+
+def _user(role_ids, admin=False):
+    """Build a lightweight stand-in for a discord.Member.
+
+    is_admin only reads roles and guild_permissions.administrator; plain
+    namespaces are far cheaper than a MagicMock tree per test.
+    """
+    return SimpleNamespace(
+        roles=[SimpleNamespace(id=role_id) for role_id in role_ids],
+        guild_permissions=SimpleNamespace(administrator=admin),
+    )
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("pokemon_red.gb", "Pokemon Red"),
+        ("super_mario_land.gb", "Super Mario Land"),
+        ("zelda.gb", "Zelda"),
+        ("GAME.GB", "Game"),
+    ],
+)
+def test_format_game_name(filename, expected):
     """Test formatting game names."""
-    assert format_game_name("pokemon_red.gb") == "Pokemon Red"
-    assert format_game_name("super_mario_land.gb") == "Super Mario Land"
-    assert format_game_name("zelda.gb") == "Zelda"
-    assert format_game_name("GAME.GB") == "Game"
+    assert format_game_name(filename) == expected
 
 
 def test_format_game_name_with_version():
@@ -25,59 +48,43 @@ def test_format_game_name_with_version():
     assert "Red" in name
 
 
-def test_format_uptime_seconds():
-    """Test formatting uptime in seconds."""
-    assert format_uptime(30) == "30s"
-    assert format_uptime(59) == "59s"
-
-
-def test_format_uptime_minutes():
-    """Test formatting uptime in minutes."""
-    assert format_uptime(60) == "1m"
-    assert format_uptime(125) == "2m 5s"
-    assert format_uptime(3599) == "59m 59s"
-
-
-def test_format_uptime_hours():
-    """Test formatting uptime in hours."""
-    assert format_uptime(3600) == "1h"
-    assert format_uptime(7265) == "2h 1m 5s"
-
-
-def test_format_uptime_days():
-    """Test formatting uptime in days."""
-    # Note: The function doesn't handle days separately, so 24h shows as hours
-    assert format_uptime(86400) == "24h"
-    assert format_uptime(90000) == "25h"
+@pytest.mark.parametrize(
+    ("seconds", "expected"),
+    [
+        (30, "30s"),
+        (59, "59s"),
+        (60, "1m"),
+        (125, "2m 5s"),
+        (3599, "59m 59s"),
+        (3600, "1h"),
+        (7265, "2h 1m 5s"),
+        # The function doesn't handle days separately, so 24h shows as hours
+        (86400, "24h"),
+        (90000, "25h"),
+    ],
+)
+def test_format_uptime(seconds, expected):
+    """Test formatting uptime across seconds, minutes and hours."""
+    assert format_uptime(seconds) == expected
 
 
 def test_is_admin_with_role(mock_config):
     """Test admin check with correct role."""
-    user = MagicMock()
-    role = MagicMock()
-    role.id = mock_config.ADMIN_ROLE_ID
-    user.roles = [role]
+    user = _user([mock_config.ADMIN_ROLE_ID])
 
     assert is_admin(user) is True
 
 
 def test_is_admin_without_role():
     """Test admin check without admin role."""
-    from discordboy.config import Config
-
-    user = MagicMock()
-    user.guild_permissions.administrator = False  # Not an admin
-    role = MagicMock()
-    role.id = 999999  # Different role ID (not matching Config.ADMIN_ROLE_ID)
-    user.roles = [role]
+    # Different role ID (not matching Config.ADMIN_ROLE_ID)
+    user = _user([999999])
 
     assert is_admin(user) is False
 
 
 def test_is_admin_no_role_configured(monkeypatch):
     """Test admin check when no admin role is configured."""
-    from discordboy import config
-
     monkeypatch.setattr(config.Config, "ADMIN_ROLE_ID", None)
 
     user = MagicMock()
@@ -89,18 +96,7 @@ def test_is_admin_no_role_configured(monkeypatch):
 
 def test_is_admin_multiple_roles(mock_config):
     """Test admin check with multiple roles."""
-    user = MagicMock()
-
-    role1 = MagicMock()
-    role1.id = 111111
-
-    role2 = MagicMock()
-    role2.id = mock_config.ADMIN_ROLE_ID
-
-    role3 = MagicMock()
-    role3.id = 333333
-
-    user.roles = [role1, role2, role3]
+    user = _user([111111, mock_config.ADMIN_ROLE_ID, 333333])
 
     assert is_admin(user) is True
 
@@ -115,10 +111,8 @@ def test_create_embed_basic():
 
 def test_create_embed_with_color():
     """Test creating embed with color."""
-    import discord
-
-    embed = create_embed("Title", "Description", discord.Color.blue())
-    assert embed.color == discord.Color.blue()
+    embed = create_embed("Title", "Description", _BLUE)
+    assert embed.color == _BLUE
 
 
 def test_create_embed_with_fields():